@@ -8,7 +8,7 @@ import time
 import webbrowser
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Dict, List, Tuple, Optional, Sequence, Union
 
 import pytz
 import requests
@@ -17,6 +17,9 @@ import yaml
 
 VERSION = "2.0.3"
 
+# 优先使用 libyaml 的 C 实现解析 YAML，未编译 libyaml 时回退到纯 Python 实现
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 # === 配置管理 ===
 def load_config():
@@ -27,7 +30,7 @@ def load_config():
         raise FileNotFoundError(f"配置文件 {config_path} 不存在")
 
     with open(config_path, "r", encoding="utf-8") as f:
-        config_data = yaml.safe_load(f)
+        config_data = yaml.load(f, Loader=YAML_LOADER)
 
     print(f"配置文件加载成功: {config_path}")
 
@@ -108,9 +111,12 @@ print(f"监控平台数量: {len(CONFIG['PLATFORMS'])}")
 
 
 # === 工具函数 ===
+BEIJING_TZ = pytz.timezone("Asia/Shanghai")
+
+
 def get_beijing_time():
     """获取北京时间"""
-    return datetime.now(pytz.timezone("Asia/Shanghai"))
+    return datetime.now(BEIJING_TZ)
 
 
 def format_date_folder():
@@ -127,10 +133,8 @@ def clean_title(title: str) -> str:
     """清理标题中的特殊字符"""
     if not isinstance(title, str):
         title = str(title)
-    cleaned_title = title.replace("\n", " ").replace("\r", " ")
-    cleaned_title = re.sub(r"\s+", " ", cleaned_title)
-    cleaned_title = cleaned_title.strip()
-    return cleaned_title
+    # split() 按任意空白切分并去除首尾空白，等价于正则 \s+ 合并，但无需走正则引擎
+    return " ".join(title.split())
 
 
 def ensure_directory_exists(directory: str):
@@ -222,6 +226,8 @@ class DataFetcher:
 
     def __init__(self, proxy_url: Optional[str] = None):
         self.proxy_url = proxy_url
+        # 所有平台请求同一接口域名，共享会话以复用连接池，避免每次重新握手
+        self.session = requests.Session()
 
     def fetch_data(
         self,
@@ -229,8 +235,8 @@ class DataFetcher:
         max_retries: int = 2,
         min_retry_wait: int = 3,
         max_retry_wait: int = 5,
-    ) -> Tuple[Optional[str], str, str]:
-        """获取指定ID数据，支持重试"""
+    ) -> Tuple[Optional[Dict], str, str]:
+        """获取指定ID数据，支持重试，返回解析后的 JSON 数据"""
         if isinstance(id_info, tuple):
             id_value, alias = id_info
         else:
@@ -254,13 +260,13 @@ class DataFetcher:
         retries = 0
         while retries <= max_retries:
             try:
-                response = requests.get(
+                response = self.session.get(
                     url, proxies=proxies, headers=headers, timeout=10
                 )
                 response.raise_for_status()
 
-                data_text = response.text
-                data_json = json.loads(data_text)
+                # 直接解析原始字节，省去先解码为文本再解析、调用方再次解析的开销
+                data_json = json.loads(response.content)
 
                 status = data_json.get("status", "未知")
                 if status not in ["success", "cache"]:
@@ -268,7 +274,7 @@ class DataFetcher:
 
                 status_info = "最新数据" if status == "success" else "缓存数据"
                 print(f"获取 {id_value} 成功（{status_info}）")
-                return data_text, id_value, alias
+                return data_json, id_value, alias
 
             except Exception as e:
                 retries += 1
@@ -301,28 +307,25 @@ class DataFetcher:
                 name = id_value
 
             id_to_name[id_value] = name
-            response, _, _ = self.fetch_data(id_info)
+            data, _, _ = self.fetch_data(id_info)
 
-            if response:
+            if data is not None:
                 try:
-                    data = json.loads(response)
-                    results[id_value] = {}
+                    results[id_value] = source_results = {}
                     for index, item in enumerate(data.get("items", []), 1):
-                        title = item["title"]
-                        url = item.get("url", "")
-                        mobile_url = item.get("mobileUrl", "")
+                        # 标题在入口处统一清理，下游保存、匹配、渲染无需重复处理
+                        title = clean_title(item["title"])
 
-                        if title in results[id_value]:
-                            results[id_value][title]["ranks"].append(index)
+                        # 单次字典查找即可判断标题是否已出现
+                        existing = source_results.get(title)
+                        if existing is not None:
+                            existing["ranks"].append(index)
                         else:
-                            results[id_value][title] = {
+                            source_results[title] = {
                                 "ranks": [index],
-                                "url": url,
-                                "mobileUrl": mobile_url,
+                                "url": item.get("url", ""),
+                                "mobileUrl": item.get("mobileUrl", ""),
                             }
-                except json.JSONDecodeError:
-                    print(f"解析 {id_value} 响应失败")
-                    failed_ids.append(id_value)
                 except Exception as e:
                     print(f"处理 {id_value} 数据出错: {e}")
                     failed_ids.append(id_value)
@@ -355,7 +358,6 @@ def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> st
             # 按排名排序标题
             sorted_titles = []
             for title, info in title_data.items():
-                cleaned_title = clean_title(title)
                 if isinstance(info, dict):
                     ranks = info.get("ranks", [])
                     url = info.get("url", "")
@@ -366,12 +368,12 @@ def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> st
                     mobile_url = ""
 
                 rank = ranks[0] if ranks else 1
-                sorted_titles.append((rank, cleaned_title, url, mobile_url))
+                sorted_titles.append((rank, title, url, mobile_url))
 
             sorted_titles.sort(key=lambda x: x[0])
 
-            for rank, cleaned_title, url, mobile_url in sorted_titles:
-                line = f"{rank}. {cleaned_title}"
+            for rank, title, url, mobile_url in sorted_titles:
+                line = f"{rank}. {title}"
 
                 if url:
                     line += f" [URL:{url}]"
@@ -389,10 +391,14 @@ def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> st
     return file_path
 
 
+# 频率词解析缓存：路径 -> (修改时间, 解析结果)
+_FREQUENCY_WORDS_CACHE: Dict[str, Tuple[int, Tuple[List[Dict], List[str]]]] = {}
+
+
 def load_frequency_words(
     frequency_file: Optional[str] = None,
 ) -> Tuple[List[Dict], List[str]]:
-    """加载频率词配置"""
+    """加载频率词配置，文件未修改时直接复用上次解析结果"""
     if frequency_file is None:
         frequency_file = os.environ.get(
             "FREQUENCY_WORDS_PATH", "config/frequency_words.txt"
@@ -402,6 +408,12 @@ def load_frequency_words(
     if not frequency_path.exists():
         raise FileNotFoundError(f"频率词文件 {frequency_file} 不存在")
 
+    cache_key = str(frequency_path.resolve())
+    mtime = frequency_path.stat().st_mtime_ns
+    cached = _FREQUENCY_WORDS_CACHE.get(cache_key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
     with open(frequency_path, "r", encoding="utf-8") as f:
         content = f.read()
 
@@ -419,7 +431,7 @@ def load_frequency_words(
 
         for word in words:
             if word.startswith("!"):
-                filter_words.append(word[1:])
+                filter_words.append(word[1:].lower())
                 group_filter_words.append(word[1:])
             elif word.startswith("+"):
                 group_required_words.append(word[1:])
@@ -432,19 +444,42 @@ def load_frequency_words(
             else:
                 group_key = " ".join(group_required_words)
 
+            # 匹配用词统一预先转小写并存为元组，普通词正则随词组缓存只编译一次
+            normal_words = tuple(word.lower() for word in group_normal_words)
             processed_groups.append(
                 {
-                    "required": group_required_words,
-                    "normal": group_normal_words,
+                    "required": tuple(word.lower() for word in group_required_words),
+                    "normal": normal_words,
+                    "normal_pattern": compile_words_pattern(normal_words),
                     "group_key": group_key,
                 }
             )
 
+    _FREQUENCY_WORDS_CACHE[cache_key] = (mtime, (processed_groups, filter_words))
     return processed_groups, filter_words
 
 
+# 标题文件解析缓存：路径 -> ((修改时间, 文件大小), 解析结果)
+_FILE_TITLES_CACHE: Dict[str, Tuple[Tuple[int, int], Tuple[Dict, Dict]]] = {}
+
+
 def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
-    """解析单个txt文件的标题数据，返回(titles_by_id, id_to_name)"""
+    """解析单个txt文件的标题数据，返回(titles_by_id, id_to_name)，结果为缓存对象，调用方只读不改"""
+    # 同一次运行中会多次读取当天文件，文件未修改时直接复用解析结果
+    file_stat = file_path.stat()
+    cache_key = str(file_path.resolve())
+    file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+
+    cached = _FILE_TITLES_CACHE.get(cache_key)
+    if cached is None or cached[0] != file_version:
+        cached = (file_version, _parse_file_titles(file_path))
+        _FILE_TITLES_CACHE[cache_key] = cached
+
+    return cached[1]
+
+
+def _parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
+    """实际解析txt文件内容"""
     titles_by_id = {}
     id_to_name = {}
 
@@ -498,7 +533,7 @@ def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
                             if url_part.endswith("]"):
                                 url = url_part[:-1]
 
-                        title = clean_title(title_part.strip())
+                        title = clean_title(title_part)
                         ranks = [rank] if rank is not None else [1]
 
                         titles_by_id[source_id][title] = {
@@ -529,17 +564,22 @@ def read_all_today_titles(
 
     files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
 
+    # 每个文件的每个来源都要做平台过滤，预先转为集合
+    platform_ids = (
+        set(current_platform_ids) if current_platform_ids is not None else None
+    )
+
     for file_path in files:
         time_info = file_path.stem
 
         titles_by_id, file_id_to_name = parse_file_titles(file_path)
 
-        if current_platform_ids is not None:
+        if platform_ids is not None:
             filtered_titles_by_id = {}
             filtered_id_to_name = {}
 
             for source_id, title_data in titles_by_id.items():
-                if source_id in current_platform_ids:
+                if source_id in platform_ids:
                     filtered_titles_by_id[source_id] = title_data
                     if source_id in file_id_to_name:
                         filtered_id_to_name[source_id] = file_id_to_name[source_id]
@@ -566,7 +606,8 @@ def process_source_data(
 ) -> None:
     """处理来源数据，合并重复标题"""
     if source_id not in all_results:
-        all_results[source_id] = title_data
+        # 后续文件会合并进该字典，复制一份以免修改标题文件的解析缓存
+        all_results[source_id] = dict(title_data)
 
         if source_id not in title_info:
             title_info[source_id] = {}
@@ -585,18 +626,23 @@ def process_source_data(
                 "mobileUrl": mobile_url,
             }
     else:
+        # 来源级别的字典只取一次，标题去重只需对其做单次查找
+        source_results = all_results[source_id]
+        source_info = title_info[source_id]
+
         for title, data in title_data.items():
             ranks = data.get("ranks", [])
             url = data.get("url", "")
             mobile_url = data.get("mobileUrl", "")
 
-            if title not in all_results[source_id]:
-                all_results[source_id][title] = {
+            existing_data = source_results.get(title)
+            if existing_data is None:
+                source_results[title] = {
                     "ranks": ranks,
                     "url": url,
                     "mobileUrl": mobile_url,
                 }
-                title_info[source_id][title] = {
+                source_info[title] = {
                     "first_time": time_info,
                     "last_time": time_info,
                     "count": 1,
@@ -605,29 +651,30 @@ def process_source_data(
                     "mobileUrl": mobile_url,
                 }
             else:
-                existing_data = all_results[source_id][title]
                 existing_ranks = existing_data.get("ranks", [])
-                existing_url = existing_data.get("url", "")
-                existing_mobile_url = existing_data.get("mobileUrl", "")
 
+                # 用集合判断排名是否已存在，保持原有先后顺序
                 merged_ranks = existing_ranks.copy()
+                seen_ranks = set(merged_ranks)
                 for rank in ranks:
-                    if rank not in merged_ranks:
+                    if rank not in seen_ranks:
+                        seen_ranks.add(rank)
                         merged_ranks.append(rank)
 
-                all_results[source_id][title] = {
+                source_results[title] = {
                     "ranks": merged_ranks,
-                    "url": existing_url or url,
-                    "mobileUrl": existing_mobile_url or mobile_url,
+                    "url": existing_data.get("url", "") or url,
+                    "mobileUrl": existing_data.get("mobileUrl", "") or mobile_url,
                 }
 
-                title_info[source_id][title]["last_time"] = time_info
-                title_info[source_id][title]["ranks"] = merged_ranks
-                title_info[source_id][title]["count"] += 1
-                if not title_info[source_id][title].get("url"):
-                    title_info[source_id][title]["url"] = url
-                if not title_info[source_id][title].get("mobileUrl"):
-                    title_info[source_id][title]["mobileUrl"] = mobile_url
+                info = source_info[title]
+                info["last_time"] = time_info
+                info["ranks"] = merged_ranks
+                info["count"] += 1
+                if not info.get("url"):
+                    info["url"] = url
+                if not info.get("mobileUrl"):
+                    info["mobileUrl"] = mobile_url
 
 
 def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -> Dict:
@@ -642,15 +689,20 @@ def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -
     if len(files) < 2:
         return {}
 
+    # 每个文件的每个来源都要做平台过滤，预先转为集合
+    platform_ids = (
+        set(current_platform_ids) if current_platform_ids is not None else None
+    )
+
     # 解析最新文件
     latest_file = files[-1]
     latest_titles, _ = parse_file_titles(latest_file)
 
     # 如果指定了当前平台列表，过滤最新文件数据
-    if current_platform_ids is not None:
+    if platform_ids is not None:
         filtered_latest_titles = {}
         for source_id, title_data in latest_titles.items():
-            if source_id in current_platform_ids:
+            if source_id in platform_ids:
                 filtered_latest_titles[source_id] = title_data
         latest_titles = filtered_latest_titles
 
@@ -660,10 +712,10 @@ def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -
         historical_data, _ = parse_file_titles(file_path)
 
         # 过滤历史数据
-        if current_platform_ids is not None:
+        if platform_ids is not None:
             filtered_historical_data = {}
             for source_id, title_data in historical_data.items():
-                if source_id in current_platform_ids:
+                if source_id in platform_ids:
                     filtered_historical_data[source_id] = title_data
             historical_data = filtered_historical_data
 
@@ -726,44 +778,68 @@ def calculate_news_weight(
     return total_weight
 
 
-def matches_word_groups(
-    title: str, word_groups: List[Dict], filter_words: List[str]
-) -> bool:
-    """检查标题是否匹配词组规则"""
-    # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
-    if not word_groups:
-        return True
+def compile_words_pattern(words: Sequence[str]) -> Optional[re.Pattern]:
+    """将多个关键词合并为单个预编译正则，一次扫描即可判断是否命中任一词，无关键词时返回 None"""
+    if not words:
+        return None
+    return re.compile("|".join(re.escape(word) for word in words))
 
-    title_lower = title.lower()
 
+def _match_word_group(
+    title_lower: str, word_groups: List[Dict], filter_pattern: Optional[re.Pattern]
+) -> Optional[Dict]:
+    """查找已转小写的标题命中的第一个词组，过滤词正则由调用方预先编译"""
     # 过滤词检查
-    if any(filter_word.lower() in title_lower for filter_word in filter_words):
-        return False
+    if filter_pattern is not None and filter_pattern.search(title_lower):
+        return None
 
     # 词组匹配检查
     for group in word_groups:
-        required_words = group["required"]
-        normal_words = group["normal"]
+        # 普通词检查：单次正则扫描即可排除大部分标题，先于必须词执行
+        normal_pattern = group["normal_pattern"]
+        if normal_pattern is not None and not normal_pattern.search(title_lower):
+            continue
 
-        # 必须词检查
-        if required_words:
-            all_required_present = all(
-                req_word.lower() in title_lower for req_word in required_words
-            )
-            if not all_required_present:
-                continue
+        # 必须词检查：任一缺失立即跳过该词组
+        for req_word in group["required"]:
+            if req_word not in title_lower:
+                break
+        else:
+            return group
 
-        # 普通词检查
-        if normal_words:
-            any_normal_present = any(
-                normal_word.lower() in title_lower for normal_word in normal_words
-            )
-            if not any_normal_present:
-                continue
+    return None
+
+
+def match_titles_to_word_groups(
+    titles: Sequence[str], word_groups: List[Dict], filter_words: Sequence[str]
+) -> List[Optional[Dict]]:
+    """批量匹配标题，返回与 titles 一一对应的命中词组，未命中或被过滤时为 None（词组需已转小写）"""
+    # 词组的普通词正则在加载时已编译，过滤词正则在整批开始前编译一次
+    filter_pattern = compile_words_pattern(filter_words)
+    return [
+        _match_word_group(title.lower(), word_groups, filter_pattern)
+        for title in titles
+    ]
 
+
+def find_matched_word_group(
+    title: str, word_groups: List[Dict], filter_words: Sequence[str]
+) -> Optional[Dict]:
+    """查找标题命中的第一个词组，未命中或被过滤时返回 None（词组需已转小写）"""
+    return _match_word_group(
+        title.lower(), word_groups, compile_words_pattern(filter_words)
+    )
+
+
+def matches_word_groups(
+    title: str, word_groups: List[Dict], filter_words: Sequence[str]
+) -> bool:
+    """检查标题是否匹配词组规则"""
+    # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
+    if not word_groups:
         return True
 
-    return False
+    return find_matched_word_group(title, word_groups, filter_words) is not None
 
 
 def format_time_display(first_time: str, last_time: str) -> str:
@@ -776,6 +852,16 @@ def format_time_display(first_time: str, last_time: str) -> str:
         return f"[{first_time} ~ {last_time}]"
 
 
+# 各平台高亮排名所用的起止标记
+RANK_HIGHLIGHT_MARKERS = {
+    "html": ("<font color='red'><strong>", "</strong></font>"),
+    "feishu": ("<font color='red'>**", "**</font>"),
+    "dingtalk": ("**", "**"),
+    "wework": ("**", "**"),
+    "telegram": ("<b>", "</b>"),
+}
+
+
 def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str) -> str:
     """统一的排名格式化方法"""
     if not ranks:
@@ -785,24 +871,9 @@ def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str)
     min_rank = unique_ranks[0]
     max_rank = unique_ranks[-1]
 
-    if format_type == "html":
-        highlight_start = "<font color='red'><strong>"
-        highlight_end = "</strong></font>"
-    elif format_type == "feishu":
-        highlight_start = "<font color='red'>**"
-        highlight_end = "**</font>"
-    elif format_type == "dingtalk":
-        highlight_start = "**"
-        highlight_end = "**"
-    elif format_type == "wework":
-        highlight_start = "**"
-        highlight_end = "**"
-    elif format_type == "telegram":
-        highlight_start = "<b>"
-        highlight_end = "</b>"
-    else:
-        highlight_start = "**"
-        highlight_end = "**"
+    highlight_start, highlight_end = RANK_HIGHLIGHT_MARKERS.get(
+        format_type, ("**", "**")
+    )
 
     if min_rank <= rank_threshold:
         if min_rank == max_rank:
@@ -819,7 +890,7 @@ def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str)
 def count_word_frequency(
     results: Dict,
     word_groups: List[Dict],
-    filter_words: List[str],
+    filter_words: Sequence[str],
     id_to_name: Dict,
     title_info: Optional[Dict] = None,
     rank_threshold: int = CONFIG["RANK_THRESHOLD"],
@@ -831,9 +902,18 @@ def count_word_frequency(
     # 如果没有配置词组，创建一个包含所有新闻的虚拟词组
     if not word_groups:
         print("频率词配置为空，将显示所有新闻")
-        word_groups = [{"required": [], "normal": [], "group_key": "全部新闻"}]
+        word_groups = [
+            {
+                "required": (),
+                "normal": (),
+                "normal_pattern": None,
+                "group_key": "全部新闻",
+            }
+        ]
         filter_words = []  # 清空过滤词，显示所有新闻
 
+    is_all_news = len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
+
     is_first_today = is_first_crawl_today()
 
     # 确定处理的数据源和新增标记逻辑
@@ -884,16 +964,13 @@ def count_word_frequency(
         results_to_process = results
         all_news_are_new = False
         total_input_news = sum(len(titles) for titles in results.values())
-        filter_status = (
-            "全部显示"
-            if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
-            else "频率词过滤"
-        )
+        filter_status = "全部显示" if is_all_news else "频率词过滤"
         print(f"当日汇总模式：处理 {total_input_news} 条新闻，模式：{filter_status}")
 
     word_stats = {}
     total_titles = 0
-    processed_titles = {}
+    # 已处理标题以 (来源ID, 标题) 组合为键
+    processed_titles = set()
     matched_new_count = 0
 
     if title_info is None:
@@ -905,165 +982,106 @@ def count_word_frequency(
         group_key = group["group_key"]
         word_stats[group_key] = {"count": 0, "titles": {}}
 
+    # 以下判断在整轮统计中不变，提前求值避免逐条标题重复计算
+    count_new_matches = (mode == "incremental" and all_news_are_new) or (
+        mode == "current" and is_first_today
+    )
+
     for source_id, titles_data in results_to_process.items():
         total_titles += len(titles_data)
 
-        if source_id not in processed_titles:
-            processed_titles[source_id] = {}
+        # 来源级别的数据只查找一次
+        source_name = id_to_name.get(source_id, source_id)
+        source_title_info = title_info.get(source_id, {})
+        source_new_titles = new_titles.get(source_id)
 
-        for title, title_data in titles_data.items():
-            if title in processed_titles.get(source_id, {}):
-                continue
+        # 同一来源的标题整批匹配，筛选的同时确定所属词组
+        matched_groups = match_titles_to_word_groups(
+            list(titles_data), word_groups, filter_words
+        )
 
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words
-            )
+        for (title, title_data), matched_group in zip(
+            titles_data.items(), matched_groups
+        ):
+            if matched_group is None:
+                continue
 
-            if not matches_frequency_words:
+            title_key = (source_id, title)
+            if title_key in processed_titles:
                 continue
 
             # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
-            if (mode == "incremental" and all_news_are_new) or (
-                mode == "current" and is_first_today
-            ):
+            if count_new_matches:
                 matched_new_count += 1
 
-            source_ranks = title_data.get("ranks", [])
-            source_url = title_data.get("url", "")
-            source_mobile_url = title_data.get("mobileUrl", "")
-
-            # 找到匹配的词组
-            title_lower = title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"全部新闻"模式，所有标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑
-                    if required_words:
-                        all_required_present = all(
-                            req_word.lower() in title_lower
-                            for req_word in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            normal_word.lower() in title_lower
-                            for normal_word in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-
-                # 对于 current 模式，从历史统计信息中获取完整数据
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time)
-
-                source_name = id_to_name.get(source_id, source_id)
-
-                # 判断是否为新增
-                is_new = False
-                if all_news_are_new:
-                    # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                    }
-                )
-
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
+            group_key = matched_group["group_key"]
+            group_stats = word_stats[group_key]
+            group_stats["count"] += 1
+            if source_id not in group_stats["titles"]:
+                group_stats["titles"][source_id] = []
+
+            first_time = ""
+            last_time = ""
+            count_info = 1
+            ranks = title_data.get("ranks") or []
+            url = title_data.get("url", "")
+            mobile_url = title_data.get("mobileUrl", "")
+
+            # 存在历史统计信息时，以其中的完整数据为准
+            info = source_title_info.get(title)
+            if info is not None:
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if info.get("ranks"):
+                    ranks = info["ranks"]
+                url = info.get("url", url)
+                mobile_url = info.get("mobileUrl", mobile_url)
+
+            if not ranks:
+                ranks = [99]
+
+            time_display = format_time_display(first_time, last_time)
+
+            # 判断是否为新增
+            is_new = False
+            if all_news_are_new:
+                # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
+                is_new = True
+            elif source_new_titles is not None:
+                # 检查是否在新增列表中
+                is_new = title in source_new_titles
+
+            group_stats["titles"][source_id].append(
+                {
+                    "title": title,
+                    "source_name": source_name,
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    "time_display": time_display,
+                    "count": count_info,
+                    "ranks": ranks,
+                    "rank_threshold": rank_threshold,
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                    "is_new": is_new,
+                }
+            )
 
-                break
+            processed_titles.add(title_key)
 
     # 最后统一打印汇总信息
     if mode == "incremental":
         if is_first_today:
             total_input_news = sum(len(titles) for titles in results.values())
-            filter_status = (
-                "全部显示"
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
-                else "频率词匹配"
-            )
+            filter_status = "全部显示" if is_all_news else "频率词匹配"
             print(
                 f"增量模式：当天第一次爬取，{total_input_news} 条新闻中有 {matched_new_count} 条{filter_status}"
             )
         else:
             if new_titles:
                 total_new_count = sum(len(titles) for titles in new_titles.values())
-                filter_status = (
-                    "全部显示"
-                    if len(word_groups) == 1
-                    and word_groups[0]["group_key"] == "全部新闻"
-                    else "匹配频率词"
-                )
+                filter_status = "全部显示" if is_all_news else "匹配频率词"
                 print(
                     f"增量模式：{total_new_count} 条新增新闻中，有 {matched_new_count} 条{filter_status}"
                 )
@@ -1074,21 +1092,13 @@ def count_word_frequency(
     elif mode == "current":
         total_input_news = sum(len(titles) for titles in results_to_process.values())
         if is_first_today:
-            filter_status = (
-                "全部显示"
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
-                else "频率词匹配"
-            )
+            filter_status = "全部显示" if is_all_news else "频率词匹配"
             print(
                 f"当前榜单模式：当天第一次爬取，{total_input_news} 条当前榜单新闻中有 {matched_new_count} 条{filter_status}"
             )
         else:
             matched_count = sum(stat["count"] for stat in word_stats.values())
-            filter_status = (
-                "全部显示"
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
-                else "频率词匹配"
-            )
+            filter_status = "全部显示" if is_all_news else "频率词匹配"
             print(
                 f"当前榜单模式：{total_input_news} 条当前榜单新闻中有 {matched_count} 条{filter_status}"
             )
@@ -1146,10 +1156,21 @@ def prepare_report_data(
         if new_titles and id_to_name:
             word_groups, filter_words = load_frequency_words()
             for source_id, titles_data in new_titles.items():
-                filtered_titles = {}
-                for title, title_data in titles_data.items():
-                    if matches_word_groups(title, word_groups, filter_words):
-                        filtered_titles[title] = title_data
+                # 如果没有配置词组，则保留所有标题（支持显示全部新闻）
+                if word_groups:
+                    # 同一来源的新增标题整批匹配
+                    matched_groups = match_titles_to_word_groups(
+                        list(titles_data), word_groups, filter_words
+                    )
+                    filtered_titles = {
+                        title: title_data
+                        for (title, title_data), matched_group in zip(
+                            titles_data.items(), matched_groups
+                        )
+                        if matched_group is not None
+                    }
+                else:
+                    filtered_titles = dict(titles_data)
                 if filtered_titles:
                     filtered_new_titles[source_id] = filtered_titles
 
@@ -1225,24 +1246,25 @@ def prepare_report_data(
 
 
 def format_title_for_platform(
-    platform: str, title_data: Dict, show_source: bool = True
+    platform: str, title_data: Dict, show_source: bool = True, show_new: bool = True
 ) -> str:
     """统一的标题格式化方法"""
+    is_new = show_new and title_data.get("is_new")
     rank_display = format_rank_display(
         title_data["ranks"], title_data["rank_threshold"], platform
     )
 
     link_url = title_data["mobile_url"] or title_data["url"]
 
-    cleaned_title = clean_title(title_data["title"])
+    title = title_data["title"]
 
     if platform == "feishu":
         if link_url:
-            formatted_title = f"[{cleaned_title}]({link_url})"
+            formatted_title = f"[{title}]({link_url})"
         else:
-            formatted_title = cleaned_title
+            formatted_title = title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if is_new else ""
 
         if show_source:
             result = f"<font color='grey'>[{title_data['source_name']}]</font> {title_prefix}{formatted_title}"
@@ -1260,11 +1282,11 @@ def format_title_for_platform(
 
     elif platform == "dingtalk":
         if link_url:
-            formatted_title = f"[{cleaned_title}]({link_url})"
+            formatted_title = f"[{title}]({link_url})"
         else:
-            formatted_title = cleaned_title
+            formatted_title = title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if is_new else ""
 
         if show_source:
             result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
@@ -1282,11 +1304,11 @@ def format_title_for_platform(
 
     elif platform == "wework":
         if link_url:
-            formatted_title = f"[{cleaned_title}]({link_url})"
+            formatted_title = f"[{title}]({link_url})"
         else:
-            formatted_title = cleaned_title
+            formatted_title = title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if is_new else ""
 
         if show_source:
             result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
@@ -1304,11 +1326,11 @@ def format_title_for_platform(
 
     elif platform == "telegram":
         if link_url:
-            formatted_title = f'<a href="{link_url}">{html_escape(cleaned_title)}</a>'
+            formatted_title = f'<a href="{link_url}">{html_escape(title)}</a>'
         else:
-            formatted_title = cleaned_title
+            formatted_title = title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if is_new else ""
 
         if show_source:
             result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
@@ -1325,13 +1347,7 @@ def format_title_for_platform(
         return result
 
     elif platform == "html":
-        rank_display = format_rank_display(
-            title_data["ranks"], title_data["rank_threshold"], "html"
-        )
-
-        link_url = title_data["mobile_url"] or title_data["url"]
-
-        escaped_title = html_escape(cleaned_title)
+        escaped_title = html_escape(title)
         escaped_source_name = html_escape(title_data["source_name"])
 
         if link_url:
@@ -1350,13 +1366,13 @@ def format_title_for_platform(
         if title_data["count"] > 1:
             formatted_title += f" <font color='green'>({title_data['count']}次)</font>"
 
-        if title_data.get("is_new"):
+        if is_new:
             formatted_title = f"<div class='new-title'>🆕 {formatted_title}</div>"
 
         return formatted_title
 
     else:
-        return cleaned_title
+        return title
 
 
 def generate_html_report(
@@ -1405,7 +1421,7 @@ def render_html_content(
     mode: str = "daily",
 ) -> str:
     """渲染HTML内容"""
-    html = """
+    html_parts = ["""
     <!DOCTYPE html>
     <html>
     <head>
@@ -1760,65 +1776,65 @@ def render_html_content(
                 <div class="header-info">
                     <div class="info-item">
                         <span class="info-label">报告类型</span>
-                        <span class="info-value">"""
+                        <span class="info-value">"""]
 
     # 处理报告类型显示
     if is_daily_summary:
         if mode == "current":
-            html += "当前榜单"
+            html_parts.append("当前榜单")
         elif mode == "incremental":
-            html += "增量模式"
+            html_parts.append("增量模式")
         else:
-            html += "当日汇总"
+            html_parts.append("当日汇总")
     else:
-        html += "实时分析"
+        html_parts.append("实时分析")
 
-    html += """</span>
+    html_parts.append("""</span>
                     </div>
                     <div class="info-item">
                         <span class="info-label">新闻总数</span>
-                        <span class="info-value">"""
+                        <span class="info-value">""")
     
-    html += f"{total_titles} 条"
+    html_parts.append(f"{total_titles} 条")
     
     # 计算筛选后的热点新闻数量
     hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
     
-    html += """</span>
+    html_parts.append("""</span>
                     </div>
                     <div class="info-item">
                         <span class="info-label">热点新闻</span>
-                        <span class="info-value">"""
+                        <span class="info-value">""")
     
-    html += f"{hot_news_count} 条"
+    html_parts.append(f"{hot_news_count} 条")
 
-    html += """</span>
+    html_parts.append("""</span>
                     </div>
                     <div class="info-item">
                         <span class="info-label">生成时间</span>
-                        <span class="info-value">"""
+                        <span class="info-value">""")
 
     now = get_beijing_time()
-    html += now.strftime('%m-%d %H:%M')
+    html_parts.append(now.strftime('%m-%d %H:%M'))
 
-    html += """</span>
+    html_parts.append("""</span>
                     </div>
                 </div>
             </div>
             
-            <div class="content">"""
+            <div class="content">""")
 
     # 处理失败ID错误信息
     if report_data["failed_ids"]:
-        html += """
+        html_parts.append("""
                 <div class="error-section">
                     <div class="error-title">⚠️ 请求失败的平台</div>
-                    <ul class="error-list">"""
+                    <ul class="error-list">""")
         for id_value in report_data["failed_ids"]:
-            html += f'<li class="error-item">{html_escape(id_value)}</li>'
-        html += """
+            html_parts.append(f'<li class="error-item">{html_escape(id_value)}</li>')
+        html_parts.append("""
                     </ul>
-                </div>"""
+                </div>""")
 
     # 处理主要统计数据
     if report_data["stats"]:
@@ -1837,7 +1853,7 @@ def render_html_content(
 
             escaped_word = html_escape(stat["word"])
             
-            html += f"""
+            html_parts.append(f"""
                 <div class="word-group">
                     <div class="word-header">
                         <div class="word-info">
@@ -1845,19 +1861,19 @@ def render_html_content(
                             <div class="word-count {count_class}">{count} 条</div>
                         </div>
                         <div class="word-index">{i}/{total_count}</div>
-                    </div>"""
+                    </div>""")
 
             # 处理每个词组下的新闻标题，给每条新闻标上序号
             for j, title_data in enumerate(stat["titles"], 1):
                 is_new = title_data.get("is_new", False)
                 new_class = "new" if is_new else ""
                 
-                html += f"""
+                html_parts.append(f"""
                     <div class="news-item {new_class}">
                         <div class="news-number">{j}</div>
                         <div class="news-content">
                             <div class="news-header">
-                                <span class="source-name">{html_escape(title_data["source_name"])}</span>"""
+                                <span class="source-name">{html_escape(title_data["source_name"])}</span>""")
                 
                 # 处理排名显示
                 ranks = title_data.get("ranks", [])
@@ -1879,23 +1895,23 @@ def render_html_content(
                     else:
                         rank_text = f"{min_rank}-{max_rank}"
                         
-                    html += f'<span class="rank-num {rank_class}">{rank_text}</span>'
+                    html_parts.append(f'<span class="rank-num {rank_class}">{rank_text}</span>')
                 
                 # 处理时间显示
                 time_display = title_data.get("time_display", "")
                 if time_display:
                     # 简化时间显示格式，将波浪线替换为~
                     simplified_time = time_display.replace(" ~ ", "~").replace("[", "").replace("]", "")
-                    html += f'<span class="time-info">{html_escape(simplified_time)}</span>'
+                    html_parts.append(f'<span class="time-info">{html_escape(simplified_time)}</span>')
                 
                 # 处理出现次数
                 count_info = title_data.get("count", 1)
                 if count_info > 1:
-                    html += f'<span class="count-info">{count_info}次</span>'
+                    html_parts.append(f'<span class="count-info">{count_info}次</span>')
                 
-                html += """
+                html_parts.append("""
                             </div>
-                            <div class="news-title">"""
+                            <div class="news-title">""")
                 
                 # 处理标题和链接
                 escaped_title = html_escape(title_data["title"])
@@ -1903,31 +1919,31 @@ def render_html_content(
                 
                 if link_url:
                     escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+                    html_parts.append(f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>')
                 else:
-                    html += escaped_title
+                    html_parts.append(escaped_title)
                 
-                html += """
+                html_parts.append("""
                             </div>
                         </div>
-                    </div>"""
+                    </div>""")
 
-            html += """
-                </div>"""
+            html_parts.append("""
+                </div>""")
 
     # 处理新增新闻区域
     if report_data["new_titles"]:
-        html += f"""
+        html_parts.append(f"""
                 <div class="new-section">
-                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>"""
+                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>""")
 
         for source_data in report_data["new_titles"]:
             escaped_source = html_escape(source_data["source_name"])
             titles_count = len(source_data["titles"])
             
-            html += f"""
+            html_parts.append(f"""
                     <div class="new-source-group">
-                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>"""
+                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>""")
 
             # 为新增新闻也添加序号
             for idx, title_data in enumerate(source_data["titles"], 1):
@@ -1949,12 +1965,12 @@ def render_html_content(
                 else:
                     rank_text = "?"
 
-                html += f"""
+                html_parts.append(f"""
                         <div class="new-item">
                             <div class="new-item-number">{idx}</div>
                             <div class="new-item-rank {rank_class}">{rank_text}</div>
                             <div class="new-item-content">
-                                <div class="new-item-title">"""
+                                <div class="new-item-title">""")
                 
                 # 处理新增新闻的链接
                 escaped_title = html_escape(title_data["title"])
@@ -1962,29 +1978,29 @@ def render_html_content(
                 
                 if link_url:
                     escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+                    html_parts.append(f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>')
                 else:
-                    html += escaped_title
+                    html_parts.append(escaped_title)
                 
-                html += """
+                html_parts.append("""
                                 </div>
                             </div>
-                        </div>"""
+                        </div>""")
 
-            html += """
-                    </div>"""
+            html_parts.append("""
+                    </div>""")
 
-        html += """
-                </div>"""
+        html_parts.append("""
+                </div>""")
 
-    html += """
+    html_parts.append("""
             </div>
         </div>
     </body>
     </html>
-    """
+    """)
 
-    return html
+    return "".join(html_parts)
 
 
 def render_feishu_content(
@@ -2046,10 +2062,8 @@ def render_feishu_content(
             )
 
             for j, title_data in enumerate(source_data["titles"], 1):
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
                 formatted_title = format_title_for_platform(
-                    "feishu", title_data_copy, show_source=False
+                    "feishu", title_data, show_source=False, show_new=False
                 )
                 text_content += f"  {j}. {formatted_title}\n"
 
@@ -2142,10 +2156,8 @@ def render_dingtalk_content(
             text_content += f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
 
             for j, title_data in enumerate(source_data["titles"], 1):
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
                 formatted_title = format_title_for_platform(
-                    "dingtalk", title_data_copy, show_source=False
+                    "dingtalk", title_data, show_source=False, show_new=False
                 )
                 text_content += f"  {j}. {formatted_title}\n"
 
@@ -2205,7 +2217,10 @@ def split_content_into_batches(
         elif format_type == "telegram":
             stats_header = f"📊 热点词汇统计\n\n"
 
+    # 批次字节数增量维护，避免每追加一行都重新编码整个批次
+    base_footer_bytes = len(base_footer.encode("utf-8"))
     current_batch = base_header
+    current_batch_bytes = len(base_header.encode("utf-8"))
     current_batch_has_content = False
 
     if (
@@ -2229,17 +2244,16 @@ def split_content_into_batches(
         total_count = len(report_data["stats"])
 
         # 添加统计标题
-        test_content = current_batch + stats_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
+        stats_header_bytes = len(stats_header.encode("utf-8"))
+        if current_batch_bytes + stats_header_bytes + base_footer_bytes < max_bytes:
+            current_batch += stats_header
+            current_batch_bytes += stats_header_bytes
             current_batch_has_content = True
         else:
             if current_batch_has_content:
                 batches.append(current_batch + base_footer)
             current_batch = base_header + stats_header
+            current_batch_bytes = len(current_batch.encode("utf-8"))
             current_batch_has_content = True
 
         # 逐个处理词组（确保词组标题+第一条新闻的原子性）
@@ -2290,20 +2304,22 @@ def split_content_into_batches(
 
             # 原子性检查：词组标题+第一条新闻必须一起处理
             word_with_first_news = word_header + first_news_line
-            test_content = current_batch + word_with_first_news
+            word_with_first_news_bytes = len(word_with_first_news.encode("utf-8"))
 
             if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
+                current_batch_bytes + word_with_first_news_bytes + base_footer_bytes
                 >= max_bytes
             ):
                 # 当前批次容纳不下，开启新批次
                 if current_batch_has_content:
                     batches.append(current_batch + base_footer)
                 current_batch = base_header + stats_header + word_with_first_news
+                current_batch_bytes = len(current_batch.encode("utf-8"))
                 current_batch_has_content = True
                 start_index = 1
             else:
-                current_batch = test_content
+                current_batch += word_with_first_news
+                current_batch_bytes += word_with_first_news_bytes
                 current_batch_has_content = True
                 start_index = 1
 
@@ -2325,17 +2341,16 @@ def split_content_into_batches(
                 if j < len(stat["titles"]) - 1:
                     news_line += "\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
+                news_line_bytes = len(news_line.encode("utf-8"))
+                if current_batch_bytes + news_line_bytes + base_footer_bytes >= max_bytes:
                     if current_batch_has_content:
                         batches.append(current_batch + base_footer)
                     current_batch = base_header + stats_header + word_header + news_line
+                    current_batch_bytes = len(current_batch.encode("utf-8"))
                     current_batch_has_content = True
                 else:
-                    current_batch = test_content
+                    current_batch += news_line
+                    current_batch_bytes += news_line_bytes
                     current_batch_has_content = True
 
             # 词组间分隔符
@@ -2346,12 +2361,10 @@ def split_content_into_batches(
                 elif format_type == "telegram":
                     separator = f"\n\n"
 
-                test_content = current_batch + separator
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    < max_bytes
-                ):
-                    current_batch = test_content
+                separator_bytes = len(separator.encode("utf-8"))
+                if current_batch_bytes + separator_bytes + base_footer_bytes < max_bytes:
+                    current_batch += separator
+                    current_batch_bytes += separator_bytes
 
     # 处理新增新闻（同样确保来源标题+第一条新闻的原子性）
     if report_data["new_titles"]:
@@ -2363,17 +2376,16 @@ def split_content_into_batches(
                 f"\n\n🆕 本次新增热点新闻 (共 {report_data['total_new_count']} 条)\n\n"
             )
 
-        test_content = current_batch + new_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
+        new_header_bytes = len(new_header.encode("utf-8"))
+        if current_batch_bytes + new_header_bytes + base_footer_bytes >= max_bytes:
             if current_batch_has_content:
                 batches.append(current_batch + base_footer)
             current_batch = base_header + new_header
+            current_batch_bytes = len(current_batch.encode("utf-8"))
             current_batch_has_content = True
         else:
-            current_batch = test_content
+            current_batch += new_header
+            current_batch_bytes += new_header_bytes
             current_batch_has_content = True
 
         # 逐个处理新增新闻来源
@@ -2388,73 +2400,71 @@ def split_content_into_batches(
             first_news_line = ""
             if source_data["titles"]:
                 first_title_data = source_data["titles"][0]
-                title_data_copy = first_title_data.copy()
-                title_data_copy["is_new"] = False
 
                 if format_type == "wework":
                     formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
+                        "wework", first_title_data, show_source=False, show_new=False
                     )
                 elif format_type == "telegram":
                     formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
+                        "telegram", first_title_data, show_source=False, show_new=False
                     )
                 else:
-                    formatted_title = f"{title_data_copy['title']}"
+                    formatted_title = f"{first_title_data['title']}"
 
                 first_news_line = f"  1. {formatted_title}\n"
 
             # 原子性检查：来源标题+第一条新闻
             source_with_first_news = source_header + first_news_line
-            test_content = current_batch + source_with_first_news
+            source_with_first_news_bytes = len(source_with_first_news.encode("utf-8"))
 
             if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
+                current_batch_bytes + source_with_first_news_bytes + base_footer_bytes
                 >= max_bytes
             ):
                 if current_batch_has_content:
                     batches.append(current_batch + base_footer)
                 current_batch = base_header + new_header + source_with_first_news
+                current_batch_bytes = len(current_batch.encode("utf-8"))
                 current_batch_has_content = True
                 start_index = 1
             else:
-                current_batch = test_content
+                current_batch += source_with_first_news
+                current_batch_bytes += source_with_first_news_bytes
                 current_batch_has_content = True
                 start_index = 1
 
             # 处理剩余新增新闻
             for j in range(start_index, len(source_data["titles"])):
                 title_data = source_data["titles"][j]
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
 
                 if format_type == "wework":
                     formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
+                        "wework", title_data, show_source=False, show_new=False
                     )
                 elif format_type == "telegram":
                     formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
+                        "telegram", title_data, show_source=False, show_new=False
                     )
                 else:
-                    formatted_title = f"{title_data_copy['title']}"
+                    formatted_title = f"{title_data['title']}"
 
                 news_line = f"  {j + 1}. {formatted_title}\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
+                news_line_bytes = len(news_line.encode("utf-8"))
+                if current_batch_bytes + news_line_bytes + base_footer_bytes >= max_bytes:
                     if current_batch_has_content:
                         batches.append(current_batch + base_footer)
                     current_batch = base_header + new_header + source_header + news_line
+                    current_batch_bytes = len(current_batch.encode("utf-8"))
                     current_batch_has_content = True
                 else:
-                    current_batch = test_content
+                    current_batch += news_line
+                    current_batch_bytes += news_line_bytes
                     current_batch_has_content = True
 
             current_batch += "\n"
+            current_batch_bytes += 1
 
     if report_data["failed_ids"]:
         failed_header = ""
@@ -2463,32 +2473,30 @@ def split_content_into_batches(
         elif format_type == "telegram":
             failed_header = f"\n\n⚠️ 数据获取失败的平台：\n\n"
 
-        test_content = current_batch + failed_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
+        failed_header_bytes = len(failed_header.encode("utf-8"))
+        if current_batch_bytes + failed_header_bytes + base_footer_bytes >= max_bytes:
             if current_batch_has_content:
                 batches.append(current_batch + base_footer)
             current_batch = base_header + failed_header
+            current_batch_bytes = len(current_batch.encode("utf-8"))
             current_batch_has_content = True
         else:
-            current_batch = test_content
+            current_batch += failed_header
+            current_batch_bytes += failed_header_bytes
             current_batch_has_content = True
 
         for i, id_value in enumerate(report_data["failed_ids"], 1):
             failed_line = f"  • {id_value}\n"
-            test_content = current_batch + failed_line
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
+            failed_line_bytes = len(failed_line.encode("utf-8"))
+            if current_batch_bytes + failed_line_bytes + base_footer_bytes >= max_bytes:
                 if current_batch_has_content:
                     batches.append(current_batch + base_footer)
                 current_batch = base_header + failed_header + failed_line
+                current_batch_bytes = len(current_batch.encode("utf-8"))
                 current_batch_has_content = True
             else:
-                current_batch = test_content
+                current_batch += failed_line
+                current_batch_bytes += failed_line_bytes
                 current_batch_has_content = True
 
     # 完成最后批次
@@ -2667,44 +2675,53 @@ def send_to_wework(
 
     print(f"企业微信消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
-    for i, batch_content in enumerate(batches, 1):
-        batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"发送企业微信第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
-        )
+    # 逐批发送（复用同一会话，各批次共享连接）
+    with requests.Session() as session:
+        for i, batch_content in enumerate(batches, 1):
+            batch_size = len(batch_content.encode("utf-8"))
+            print(
+                f"发送企业微信第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
+            )
 
-        # 添加批次标识
-        if len(batches) > 1:
-            batch_header = f"**[第 {i}/{len(batches)} 批次]**\n\n"
-            batch_content = batch_header + batch_content
+            # 添加批次标识
+            if len(batches) > 1:
+                batch_header = f"**[第 {i}/{len(batches)} 批次]**\n\n"
+                batch_content = batch_header + batch_content
 
-        payload = {"msgtype": "markdown", "markdown": {"content": batch_content}}
+            payload = {"msgtype": "markdown", "markdown": {"content": batch_content}}
 
-        try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("errcode") == 0:
-                    print(f"企业微信第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
+            try:
+                response = session.post(
+                    webhook_url,
+                    headers=headers,
+                    json=payload,
+                    proxies=proxies,
+                    timeout=30,
+                )
+                if response.status_code == 200:
+                    result = response.json()
+                    if result.get("errcode") == 0:
+                        print(
+                            f"企业微信第 {i}/{len(batches)} 批次发送成功 [{report_type}]"
+                        )
+                        # 批次间间隔
+                        if i < len(batches):
+                            time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
+                    else:
+                        print(
+                            f"企业微信第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('errmsg')}"
+                        )
+                        return False
                 else:
                     print(
-                        f"企业微信第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('errmsg')}"
+                        f"企业微信第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
                     )
                     return False
-            else:
+            except Exception as e:
                 print(
-                    f"企业微信第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
+                    f"企业微信第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}"
                 )
                 return False
-        except Exception as e:
-            print(f"企业微信第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
-            return False
 
     print(f"企业微信所有 {len(batches)} 批次发送完成 [{report_type}]")
     return True
@@ -2734,49 +2751,54 @@ def send_to_telegram(
 
     print(f"Telegram消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
-    for i, batch_content in enumerate(batches, 1):
-        batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"发送Telegram第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
-        )
+    # 逐批发送（复用同一会话，各批次共享连接）
+    with requests.Session() as session:
+        for i, batch_content in enumerate(batches, 1):
+            batch_size = len(batch_content.encode("utf-8"))
+            print(
+                f"发送Telegram第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
+            )
 
-        # 添加批次标识
-        if len(batches) > 1:
-            batch_header = f"<b>[第 {i}/{len(batches)} 批次]</b>\n\n"
-            batch_content = batch_header + batch_content
+            # 添加批次标识
+            if len(batches) > 1:
+                batch_header = f"<b>[第 {i}/{len(batches)} 批次]</b>\n\n"
+                batch_content = batch_header + batch_content
 
-        payload = {
-            "chat_id": chat_id,
-            "text": batch_content,
-            "parse_mode": "HTML",
-            "disable_web_page_preview": True,
-        }
+            payload = {
+                "chat_id": chat_id,
+                "text": batch_content,
+                "parse_mode": "HTML",
+                "disable_web_page_preview": True,
+            }
 
-        try:
-            response = requests.post(
-                url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("ok"):
-                    print(f"Telegram第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
+            try:
+                response = session.post(
+                    url, headers=headers, json=payload, proxies=proxies, timeout=30
+                )
+                if response.status_code == 200:
+                    result = response.json()
+                    if result.get("ok"):
+                        print(
+                            f"Telegram第 {i}/{len(batches)} 批次发送成功 [{report_type}]"
+                        )
+                        # 批次间间隔
+                        if i < len(batches):
+                            time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
+                    else:
+                        print(
+                            f"Telegram第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('description')}"
+                        )
+                        return False
                 else:
                     print(
-                        f"Telegram第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('description')}"
+                        f"Telegram第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
                     )
                     return False
-            else:
+            except Exception as e:
                 print(
-                    f"Telegram第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
+                    f"Telegram第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}"
                 )
                 return False
-        except Exception as e:
-            print(f"Telegram第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
-            return False
 
     print(f"Telegram所有 {len(batches)} 批次发送完成 [{report_type}]")
     return True